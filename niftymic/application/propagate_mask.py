@@ -17,6 +17,7 @@ import niftymic.base.data_writer as dw
 import niftymic.base.stack as st
 import niftymic.registration.flirt as regflirt
 import niftymic.registration.niftyreg as niftyreg
+import niftymic.registration.simple_itk_registration as regsitk
 import niftymic.utilities.stack_mask_morphological_operations as stmorph
 from niftymic.utilities.input_arparser import InputArgparser
 
@@ -95,6 +96,13 @@ def main():
             # options=options,
             use_verbose=False,
         )
+    elif args.method == "SimpleITK":
+        registration = regsitk.get_rigid_volume_to_volume_registration(
+            fixed=stack,
+            moving=template,
+            use_fixed_mask=False,
+            use_moving_mask=args.use_moving_mask,
+        )
     else:
         registration = niftyreg.RegAladin(
             registration_type="Rigid",
@@ -106,6 +106,14 @@ def main():
         "specified interleave (--interleave) are registered until each "
         "slice is registered independently."
     )
+    input_parser.add_option(
+        option_string="--s2v-hierarchical-processes",
+        type=int,
+        help="Number of processes used to register the stacks in parallel "
+        "during the hierarchical slice-to-volume registration "
+        "(--s2v-hierarchical).",
+        default=1,
+    )
     input_parser.add_argument(
         "--sda", "-sda",
         action='store_true',
@@ -243,6 +251,11 @@ def main():
                 options=options,
                 use_verbose=False,
             )
+        elif args.v2v_method == "SimpleITK":
+            # In-process (multi-threaded) registration which avoids the
+            # image I/O of the command line tools
+            vol_registration = \
+                regsitk.get_rigid_volume_to_volume_registration()
         else:
             vol_registration = niftyreg.RegAladin(
                 registration_type="Rigid",
@@ -446,6 +459,7 @@ def main():
                 viewer=args.viewer,
                 verbose=args.verbose,
                 use_hierarchical_registration=args.s2v_hierarchical,
+                n_processes=args.s2v_hierarchical_processes,
             )
         two_step_s2v_reg_recon.run()
         HR_volume_iterations = \
@@ -9,6 +9,7 @@
 #
 
 import os
+import hashlib
 import numpy as np
 import SimpleITK as sitk
 
@@ -76,6 +77,25 @@ def main():
         help="If given, input images are interpreted as image masks. "
         "Obtained volumetric reconstruction will be exported in uint8 format."
     )
+    input_parser.add_option(
+        option_string="--crop-to-masks",
+        type=int,
+        help="Crop reconstruction space given by --reconstruction-space to "
+        "the bounding box of the union of all (motion-corrected) slice masks "
+        "(plus --extra-frame-target) to restrict the computation to the "
+        "region of interest. Only has an effect together with "
+        "--reconstruction-space as, otherwise, the reconstruction space is "
+        "already cropped to the mask of the target stack.",
+        default=0,
+    )
+    input_parser.add_option(
+        option_string="--cache-init",
+        type=int,
+        help="Cache the isotropically resampled target stack used to define "
+        "the reconstruction space in the output directory (.cache) and "
+        "reuse it in subsequent runs with identical input.",
+        default=0,
+    )
     input_parser.add_argument(
         "--sda", "-sda",
         action='store_true',
@@ -177,10 +197,45 @@ def main():
     # Reconstruction space defined by isotropically resampled,
     # bounding box-cropped target stack
     if args.reconstruction_space is None:
-        recon0 = stacks[target_stack_index].get_isotropically_resampled_stack(
-            resolution=args.isotropic_resolution,
-            extra_frame=args.extra_frame_target,
-        )
+        target_stack = stacks[target_stack_index]
+
+        if args.cache_init:
+            # Key depends on image data, mask and geometry of the target
+            # stack and on the resampling parameters
+            hash_sha256 = hashlib.sha256()
+            hash_sha256.update(
+                sitk.GetArrayViewFromImage(target_stack.sitk).tobytes())
+            hash_sha256.update(
+                sitk.GetArrayViewFromImage(target_stack.sitk_mask).tobytes())
+            hash_sha256.update(str((
+                target_stack.sitk.GetOrigin(),
+                target_stack.sitk.GetSpacing(),
+                target_stack.sitk.GetDirection(),
+                args.isotropic_resolution,
+                args.extra_frame_target,
+            )).encode())
+            path_to_cache = os.path.join(
+                dir_output, ".cache", "%s.nii.gz" % hash_sha256.hexdigest())
+            path_to_cache_mask = ph.append_to_filename(path_to_cache, "_mask")
+
+        if args.cache_init and ph.file_exists(path_to_cache) and \
+                ph.file_exists(path_to_cache_mask):
+            ph.print_info("Read cached initial volume %s" % path_to_cache)
+            recon0 = st.Stack.from_filename(
+                path_to_cache, path_to_cache_mask, extract_slices=False)
+            recon0.set_filename(
+                target_stack.get_filename() + "_LinearIso")
+        else:
+            recon0 = target_stack.get_isotropically_resampled_stack(
+                resolution=args.isotropic_resolution,
+                extra_frame=args.extra_frame_target,
+            )
+            if args.cache_init:
+                ph.create_directory(os.path.dirname(path_to_cache))
+                dw.DataWriter.write_image(
+                    recon0.sitk, path_to_cache, compress=False)
+                dw.DataWriter.write_mask(recon0.sitk_mask, path_to_cache_mask)
+
         recon0 = recon0.get_cropped_stack_based_on_mask(
             boundary_i=args.extra_frame_target,
             boundary_j=args.extra_frame_target,
@@ -203,6 +258,26 @@ def main():
         recon0 = stacks[target_stack_index].get_resampled_stack(recon0.sitk)
         recon0 = recon0.get_stack_multiplied_with_mask()
 
+        # Restrict reconstruction space to bounding box of all slice masks
+        if args.crop_to_masks:
+            nda_mask = np.zeros(recon0.sitk.GetSize()[::-1], dtype=np.uint8)
+            for stack in stacks:
+                # Slice masks at their motion-corrected positions
+                stack_resampled = stack.get_resampled_stack_from_slices(
+                    resampling_grid=recon0, interpolator="NearestNeighbor")
+                nda_mask |= sitk.GetArrayViewFromImage(
+                    stack_resampled.sitk_mask) > 0
+            mask_sitk = sitk.GetImageFromArray(nda_mask)
+            mask_sitk.CopyInformation(recon0.sitk)
+
+            recon0 = recon0.get_cropped_stack_based_on_mask(
+                boundary_i=args.extra_frame_target,
+                boundary_j=args.extra_frame_target,
+                boundary_k=args.extra_frame_target,
+                unit="mm",
+                mask_sitk=mask_sitk,
+            )
+
     ph.print_info(
         "Reconstruction space defined with %s mm3 resolution" %
         " x ".join(["%.2f" % s for s in recon0.sitk.GetSpacing()])
@@ -55,7 +55,8 @@ def main():
         default=None)
     input_parser.add_v2v_method(
         option_string="--method",
-        help="Registration method used for the registration.",
+        help="Registration method used for the registration "
+        "(FLIRT, RegAladin).",
         default="RegAladin",
     )
     input_parser.add_argument(
@@ -80,6 +81,11 @@ def main():
             "allowed transformation extensions are: '.txt'" % (
                 args.output))
 
+    # Registration is performed with the command line tools which allow to
+    # pass initial transforms
+    if args.method not in ["FLIRT", "RegAladin"]:
+        raise ValueError("method must be in {FLIRT, RegAladin}")
+
     if args.initial_transform is not None and args.init_pca:
         raise IOError(
             "Both --initial-transform and --init-pca cannot be activated. "
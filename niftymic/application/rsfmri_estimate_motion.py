@@ -57,6 +57,7 @@ def main():
     input_parser.add_iterations(default=10)
     input_parser.add_log_config(default=1)
     input_parser.add_minimizer(default="lsmr")
+    input_parser.add_multiresolution(default=0)
     input_parser.add_argument(
         "--prototyping", "-prototyping",
         action='store_true',
@@ -65,7 +66,9 @@ def main():
     )
     input_parser.add_reconstruction_type(default="TK1L2")
     input_parser.add_rho(default=0.5)
+    input_parser.add_shrink_factors(default=[2, 1])
     input_parser.add_sigma(default=0.8)
+    input_parser.add_smoothing_sigmas(default=[1, 0])
     input_parser.add_stack_recon_range(default=15)
     input_parser.add_target_stack_index(default=0)
     input_parser.add_two_step_cycles(default=3)
@@ -152,6 +155,8 @@ def main():
             use_moving_mask=True,
             use_verbose=False,
         )
+    elif args.v2v_method == "SimpleITK":
+        registration_v2v = regsitk.get_rigid_volume_to_volume_registration()
     else:
         registration_v2v = regniftyreg.RegAladin(
             registration_type="Rigid",
@@ -170,9 +175,9 @@ def main():
         metric="Correlation",
         # metric="MattesMutualInformation",  # Might cause error messages
         # like "Too many samples map outside moving image buffer."
-        # use_multiresolution_framework=True,
-        shrink_factors=[2, 1],
-        smoothing_sigmas=[1, 0],
+        use_multiresolution_framework=args.multiresolution,
+        shrink_factors=args.shrink_factors,
+        smoothing_sigmas=args.smoothing_sigmas,
         initializer_type="SelfGEOMETRY",
         optimizer="ConjugateGradientLineSearch",
         optimizer_params={
@@ -87,6 +87,9 @@ class Slice:
         # Store current affine transform of image
         slice._affine_transform_sitk = sitkh.get_sitk_affine_transform_from_sitk_image(
             slice.sitk)
+        slice._affine_transform_nda = \
+            slice.get_homogeneous_matrix_from_sitk_transform(
+                slice._affine_transform_sitk)
 
         # Prepare history of affine transforms, i.e. encoded spatial
         #  position+orientation of slice, and rigid motion estimates of slice
@@ -156,6 +159,9 @@ class Slice:
         # Store current affine transform of image
         slice._affine_transform_sitk = sitkh.get_sitk_affine_transform_from_sitk_image(
             slice.sitk)
+        slice._affine_transform_nda = \
+            slice.get_homogeneous_matrix_from_sitk_transform(
+                slice._affine_transform_sitk)
 
         # Prepare history of affine transforms, i.e. encoded spatial
         #  position+orientation of slice, and motion estimates of slice
@@ -198,6 +204,9 @@ class Slice:
         # Store current affine transform of image
         slice._affine_transform_sitk = sitkh.get_sitk_affine_transform_from_sitk_image(
             slice.sitk)
+        slice._affine_transform_nda = \
+            slice.get_homogeneous_matrix_from_sitk_transform(
+                slice._affine_transform_sitk)
 
         # Prepare history of affine transforms, i.e. encoded spatial
         #  position+orientation of slice, and rigid motion estimates of slice
@@ -224,15 +233,81 @@ class Slice:
         # Update rigid motion estimate
         current_rigid_motion_estimate = sitkh.get_composite_sitk_affine_transform(
             affine_transform_sitk, self._history_motion_corrections[-1])
-        self._history_motion_corrections.append(current_rigid_motion_estimate)
 
         # New affine transform of slice after rigid motion correction
-        affine_transform = sitkh.get_composite_sitk_affine_transform(
-            affine_transform_sitk, self._affine_transform_sitk)
+        affine_transform_nda = self.get_homogeneous_matrix_from_sitk_transform(
+            affine_transform_sitk).dot(self._affine_transform_nda)
+        affine_transform = \
+            self.get_sitk_affine_transform_from_homogeneous_matrix(
+                affine_transform_nda)
+
+        self._update_motion_correction(
+            current_rigid_motion_estimate,
+            affine_transform,
+            affine_transform_nda)
+
+    ##
+    # Motion correction update of several slices with the same transform.
+    # \date       2026-10-15 10:12:41+0100
+    #
+    # Same outcome as calling update_motion_correction for each slice but the
+    # compositions with the slices' motion corrections and affine transforms
+    # are computed for all slices at once.
+    #
+    # \param      slices                 list of Slice objects
+    # \param[in]  affine_transform_sitk  transform as sitk.AffineTransform
+    #                                    object
+    # \post       origin and direction of slices get updated based on
+    #             transform
+    #
+    @staticmethod
+    def update_joint_motion_correction(slices, affine_transform_sitk):
+        if len(slices) == 0:
+            return
+
+        motion_corrections_sitk = Slice._get_composite_sitk_affine_transforms(
+            affine_transform_sitk,
+            [s.get_motion_correction_transform() for s in slices])
+
+        # Composite affine transforms of slices using their cached
+        # homogeneous matrix representations
+        affine_transforms_nda = np.einsum(
+            "ij,njk->nik",
+            Slice.get_homogeneous_matrix_from_sitk_transform(
+                affine_transform_sitk),
+            np.array([s.get_affine_transform_nda() for s in slices]))
+
+        for i, slice in enumerate(slices):
+            slice._update_motion_correction(
+                motion_corrections_sitk[i],
+                Slice.get_sitk_affine_transform_from_homogeneous_matrix(
+                    affine_transforms_nda[i]),
+                affine_transforms_nda[i])
+
+    ##
+    # Append already composited motion correction and affine transform to the
+    # registration history and update the slice position in physical space.
+    # \date       2026-10-15 10:12:41+0100
+    #
+    # \param      self                   The object
+    # \param      motion_correction_sitk  current motion estimate, i.e.
+    #                                     composition of new transform with
+    #                                     last motion correction
+    # \param      affine_transform_sitk   new affine transform of slice as
+    #                                     sitk.AffineTransform object
+    # \param      affine_transform_nda    homogeneous matrix of
+    #                                     affine_transform_sitk (optional)
+    #
+    def _update_motion_correction(self,
+                                  motion_correction_sitk,
+                                  affine_transform_sitk,
+                                  affine_transform_nda=None):
+        self._history_motion_corrections.append(motion_correction_sitk)
 
         # Update affine transform of slice, i.e. change image origin and
         # direction in physical space
-        self._update_affine_transform(affine_transform)
+        self._update_affine_transform(
+            affine_transform_sitk, affine_transform_nda)
 
     # ## Update rigid motion estimate of slice and update its position in
     # #  physical space accordingly.
@@ -276,6 +351,121 @@ class Slice:
     def get_directory(self):
         return self._dir_input
 
+    ##
+    # Gets the origin of the slice in physical space.
+    #
+    # The origin is read from the cached homogeneous matrix of the affine
+    # transform so that no SimpleITK call is required.
+    # \date       2026-10-15 12:48:10+0100
+    #
+    # \param      self  The object
+    #
+    # \return     The origin as numpy array.
+    #
+    def get_origin(self):
+        return np.array(self._affine_transform_nda[0:3, 3])
+
+    ##
+    # Gets the current affine transform of the slice, i.e. the transform from
+    # voxel to physical space, as homogeneous matrix.
+    # \date       2026-10-15 13:21:54+0100
+    #
+    # \param      self  The object
+    #
+    # \return     The affine transform as 4x4 numpy array.
+    #
+    def get_affine_transform_nda(self):
+        return np.array(self._affine_transform_nda)
+
+    ##
+    # Gets the homogeneous matrix representation of a transform.
+    # \date       2026-10-15 13:21:54+0100
+    #
+    # \param      transform_sitk  transform as sitk object providing matrix,
+    #                             translation and center, e.g.
+    #                             sitk.AffineTransform
+    #
+    # \return     homogeneous matrix as (dim+1) x (dim+1) numpy array
+    #
+    @staticmethod
+    def get_homogeneous_matrix_from_sitk_transform(transform_sitk):
+        dim = transform_sitk.GetDimension()
+        A = np.asarray(transform_sitk.GetMatrix()).reshape(dim, dim)
+        c = np.asarray(transform_sitk.GetCenter())
+        t = np.asarray(transform_sitk.GetTranslation())
+
+        H = np.eye(dim + 1)
+        H[0:dim, 0:dim] = A
+        H[0:dim, dim] = t + c - A.dot(c)
+
+        return H
+
+    ##
+    # Gets the sitk.AffineTransform (with zero center) of a homogeneous
+    # matrix.
+    # \date       2026-10-15 13:21:54+0100
+    #
+    # \param      H     homogeneous matrix as (dim+1) x (dim+1) numpy array
+    #
+    # \return     affine transform as sitk.AffineTransform object
+    #
+    @staticmethod
+    def get_sitk_affine_transform_from_homogeneous_matrix(H):
+        dim = H.shape[0] - 1
+        return sitk.AffineTransform(
+            H[0:dim, 0:dim].flatten(), H[0:dim, dim])
+
+    ##
+    # Composite one transform with a list of transforms, i.e. compute
+    # transform_outer o transform_inner for each inner transform.
+    #
+    # Same result as calling sitkh.get_composite_sitk_affine_transform for
+    # each element but with matrices and translations composited in one go.
+    # \date       2026-10-15 10:24:52+0100
+    #
+    # \param      transform_outer   outer transform as sitk transform object
+    # \param      transforms_inner  list of inner sitk transform objects
+    #
+    # \return     list of composite transforms of same type as returned by
+    #             sitkh.get_composite_sitk_affine_transform
+    #
+    @staticmethod
+    def _get_composite_sitk_affine_transforms(transform_outer,
+                                              transforms_inner):
+
+        dim = transform_outer.GetDimension()
+
+        A_outer = np.asarray(transform_outer.GetMatrix()).reshape(dim, dim)
+        c_outer = np.asarray(transform_outer.GetCenter())
+        t_outer = np.asarray(transform_outer.GetTranslation())
+
+        A_inner = np.array(
+            [t.GetMatrix() for t in transforms_inner]).reshape(-1, dim, dim)
+        c_inner = np.array([t.GetCenter() for t in transforms_inner])
+        t_inner = np.array([t.GetTranslation() for t in transforms_inner])
+
+        A_composite = np.einsum("ij,njk->nik", A_outer, A_inner)
+        t_composite = np.einsum(
+            "ij,nj->ni", A_outer, t_inner + c_inner - c_outer) + \
+            t_outer + c_outer - c_inner
+
+        name_outer = transform_outer.GetName()
+        transforms = [None] * len(transforms_inner)
+        for i, transform_inner in enumerate(transforms_inner):
+            name_inner = transform_inner.GetName()
+            if name_outer == "AffineTransform" \
+                    or name_inner == "AffineTransform" \
+                    or name_outer != name_inner:
+                transform = sitk.AffineTransform(dim)
+            else:
+                transform = getattr(sitk, name_outer)()
+            transform.SetMatrix(A_composite[i].flatten())
+            transform.SetTranslation(t_composite[i])
+            transform.SetCenter(c_inner[i])
+            transforms[i] = transform
+
+        return transforms
+
     # Get current affine transformation defining the spatial position in
     #  physical space of slice
     #  \return affine transformation, sitk.AffineTransform object
@@ -395,7 +585,11 @@ class Slice:
     #  position of slice in physical space. The transform is obtained via
     #  slice-to-volume registration step, e.g.
     #  \param[in] affine_transform_sitk affine transform as sitk-object
-    def _update_affine_transform(self, affine_transform_sitk):
+    #  \param[in] affine_transform_nda homogeneous matrix of the affine
+    #             transform; computed from affine_transform_sitk if None
+    def _update_affine_transform(self,
+                                 affine_transform_sitk,
+                                 affine_transform_nda=None):
 
         # Ensure correct object type
         self._affine_transform_sitk = sitk.AffineTransform(
@@ -404,12 +598,17 @@ class Slice:
         # Append transform to registration history
         self._history_affine_transforms.append(affine_transform_sitk)
 
+        if affine_transform_nda is None:
+            affine_transform_nda = \
+                self.get_homogeneous_matrix_from_sitk_transform(
+                    affine_transform_sitk)
+        self._affine_transform_nda = affine_transform_nda
+
         # Get origin and direction of transformed 3D slice given the new
-        # spatial transform
-        origin = sitkh.get_sitk_image_origin_from_sitk_affine_transform(
-            affine_transform_sitk, self.sitk)
-        direction = sitkh.get_sitk_image_direction_from_sitk_affine_transform(
-            affine_transform_sitk, self.sitk)
+        # spatial transform, i.e. T(i) = R*S*i + origin
+        spacing = np.array(self.sitk.GetSpacing())
+        origin = affine_transform_nda[0:3, 3]
+        direction = (affine_transform_nda[0:3, 0:3] / spacing).flatten()
 
         # Update image objects
         self.sitk.SetOrigin(origin)
@@ -9,6 +9,7 @@
 
 import os
 import re
+import itertools
 import numpy as np
 import SimpleITK as sitk
 
@@ -440,6 +441,24 @@ class Stack:
 
         return self._slices[index]
 
+    ##
+    # Gets the origins of slices of the stack in physical space.
+    # \date       2026-10-15 12:52:33+0100
+    #
+    # \param      self     The object
+    # \param      indices  indices of slices w.r.t. get_slices(), i.e.
+    #                     deleted slices are not counted (same as for
+    #                     update_joint_motion_correction_of_slices); all
+    #                     slices are used if None
+    #
+    # \return     slice origins as (N, 3) numpy array
+    #
+    def get_slice_origins(self, indices=None):
+        slices = self.get_slices()
+        if indices is not None:
+            slices = [slices[i] for i in indices]
+        return np.array([s.get_origin() for s in slices]).reshape(-1, 3)
+
     def get_slice_thickness(self):
         return float(self._slice_thickness)
 
@@ -683,8 +702,32 @@ class Stack:
 
         # Update slices
         if self.get_slices() is not None:
-            for i in range(0, self._N_slices):
-                self._slices[i].update_motion_correction(affine_transform_sitk)
+            self.update_joint_motion_correction_of_slices(
+                affine_transform_sitk)
+
+    ##
+    # Apply the same transform on a selection of slices of the stack. Stack
+    # itself is not getting transformed.
+    #
+    # The compositions with the slices' motion corrections and affine
+    # transforms are computed for all selected slices at once, see
+    # Slice.update_joint_motion_correction.
+    # \date       2026-10-15 10:31:07+0100
+    #
+    # \param      self                   The object
+    # \param      affine_transform_sitk  transform as sitk.AffineTransform
+    #                                    object
+    # \param      indices                indices of slices w.r.t. get_slices();
+    #                                    all slices are updated if None
+    #
+    def update_joint_motion_correction_of_slices(self,
+                                                 affine_transform_sitk,
+                                                 indices=None):
+        slices = self.get_slices()
+        if indices is not None:
+            slices = [slices[i] for i in indices]
+
+        sl.Slice.update_joint_motion_correction(slices, affine_transform_sitk)
 
     ##
     #       Apply transforms on all the slices of the stack. Stack itself
@@ -705,6 +748,45 @@ class Stack:
             raise ValueError("Number of affine transforms does not match the "
                              "number of slices")
 
+    ##
+    # Gets the voxel region of a grid covered by the physical extent of an
+    # image, plus a margin of one voxel.
+    # \date       2026-10-15 12:20:45+0100
+    #
+    # \param      image_sitk  image as sitk.Image object, e.g. a slice
+    # \param      grid_sitk   grid as sitk.Image object
+    #
+    # \return     index and size of the region in grid_sitk as lists; None if
+    #             the image does not overlap with the grid
+    #
+    @staticmethod
+    def _get_region_covered_by_image(image_sitk, grid_sitk):
+
+        # Corners of the image extent given by voxel boundaries
+        size = np.array(image_sitk.GetSize())
+        corners = [
+            image_sitk.TransformContinuousIndexToPhysicalPoint(
+                [float(c) for c in corner])
+            for corner in itertools.product(*[[-0.5, n - 0.5] for n in size])
+        ]
+
+        # Continuous indices of corners in grid space
+        indices = np.array([
+            grid_sitk.TransformPhysicalPointToContinuousIndex(corner)
+            for corner in corners])
+
+        grid_size = np.array(grid_sitk.GetSize())
+        index_min = np.maximum(np.floor(indices.min(axis=0)) - 1, 0)
+        index_max = np.minimum(np.ceil(indices.max(axis=0)) + 2, grid_size)
+
+        if np.any(index_max <= index_min):
+            return None
+
+        index = [int(i) for i in index_min]
+        size = [int(i) for i in index_max - index_min]
+
+        return index, size
+
     def _update_affine_transform(self, affine_transform_sitk):
 
         # Ensure correct object type
@@ -787,67 +869,83 @@ class Stack:
         # Get shape of image data array
         nda_shape = resampling_grid.sitk.GetSize()[::-1]
 
-        # Create zero image and its mask aligned with sitk.Image
+        # Preallocate data arrays of image and its mask to accumulate the
+        # resampled slices in-place. Mask and counter only hold integer
+        # counts of overlapping slices so that 16 bit suffice.
         nda = np.zeros(nda_shape)
-
-        stack_resampled_sitk = sitk.GetImageFromArray(nda)
-        stack_resampled_sitk.CopyInformation(resampling_grid.sitk)
-        stack_resampled_sitk = sitk.Cast(
-            stack_resampled_sitk, resampling_grid.sitk.GetPixelIDValue())
-
-        stack_resampled_sitk_mask = sitk.GetImageFromArray(nda.astype("uint8"))
-        stack_resampled_sitk_mask.CopyInformation(resampling_grid.sitk_mask)
-        stack_resampled_sitk_mask = sitk.Cast(
-            stack_resampled_sitk_mask, resampling_grid.sitk_mask.GetPixelIDValue())
+        nda_mask = np.zeros(nda_shape, dtype=np.uint16)
 
         # Create helper used for normalization at the end
-        nda_stack_covered_indices = np.zeros(nda_shape)
-
-        for i in range(0, self._N_slices):
-            slice = self._slices[i]
+        nda_stack_covered_indices = np.zeros(nda_shape, dtype=np.uint16)
+
+        for slice_k in self.get_slices():
+
+            # Restrict resampling to the region of the resampling grid
+            # covered by the slice. Outside, the resampled slice equals the
+            # default pixel value which only contributes if non-zero.
+            if default_pixel_value == 0:
+                region = self._get_region_covered_by_image(
+                    slice_k.sitk, resampling_grid.sitk)
+                if region is None:
+                    continue
+                index, size = region
+            else:
+                index = [0, 0, 0]
+                size = list(resampling_grid.sitk.GetSize())
+            origin = resampling_grid.sitk.TransformIndexToPhysicalPoint(index)
+            nda_region = tuple(
+                slice(i, i + n) for i, n in zip(index[::-1], size[::-1]))
 
             # Resample slice and its mask to stack space (volume)
             stack_resampled_slice_sitk = sitk.Resample(
-                slice.sitk,
-                resampling_grid.sitk,
+                slice_k.sitk,
+                size,
                 sitk.Euler3DTransform(),
                 interpolator,
+                origin,
+                resampling_grid.sitk.GetSpacing(),
+                resampling_grid.sitk.GetDirection(),
                 default_pixel_value,
                 resampling_grid.sitk.GetPixelIDValue())
 
             stack_resampled_slice_sitk_mask = sitk.Resample(
-                slice.sitk_mask,
-                resampling_grid.sitk_mask,
+                slice_k.sitk_mask,
+                size,
                 sitk.Euler3DTransform(),
                 sitk.sitkNearestNeighbor,
+                origin,
+                resampling_grid.sitk_mask.GetSpacing(),
+                resampling_grid.sitk_mask.GetDirection(),
                 0,
                 resampling_grid.sitk_mask.GetPixelIDValue())
 
-            # Add resampled slice and mask to stack space
-            stack_resampled_sitk += stack_resampled_slice_sitk
-            stack_resampled_sitk_mask += stack_resampled_slice_sitk_mask
-
-            # Get indices which are updated in stack space
-            nda_stack_resampled_slice_ind = sitk.GetArrayFromImage(
-                stack_resampled_slice_sitk)
-            ind = np.nonzero(nda_stack_resampled_slice_ind)
+            # Add resampled slice and mask to stack space (array views avoid
+            # copying the resampled images)
+            nda_slice = sitk.GetArrayViewFromImage(stack_resampled_slice_sitk)
+            nda[nda_region] += nda_slice
+            nda_mask[nda_region] += sitk.GetArrayViewFromImage(
+                stack_resampled_slice_sitk_mask)
 
             # Increment counter for respective updated voxels
-            nda_stack_covered_indices[ind] += 1
+            nda_stack_covered_indices[nda_region] += nda_slice != 0
 
         # Set voxels with zero counter to 1 so as to have well-defined
         # normalization
         nda_stack_covered_indices[nda_stack_covered_indices == 0] = 1
 
         # Normalize resampled image
-        stack_normalization = sitk.GetImageFromArray(nda_stack_covered_indices)
-        stack_normalization.CopyInformation(resampling_grid.sitk)
-        stack_normalization = sitk.Cast(
-            stack_normalization, resampling_grid.sitk.GetPixelIDValue())
-        stack_resampled_sitk /= stack_normalization
+        nda /= nda_stack_covered_indices
+
+        stack_resampled_sitk = sitk.GetImageFromArray(nda)
+        stack_resampled_sitk.CopyInformation(resampling_grid.sitk)
+        stack_resampled_sitk = sitk.Cast(
+            stack_resampled_sitk, resampling_grid.sitk.GetPixelIDValue())
 
-        # Get valid binary mask
-        stack_resampled_slice_sitk_mask /= stack_resampled_slice_sitk_mask
+        stack_resampled_sitk_mask = sitk.GetImageFromArray(nda_mask)
+        stack_resampled_sitk_mask.CopyInformation(resampling_grid.sitk_mask)
+        stack_resampled_sitk_mask = sitk.Cast(
+            stack_resampled_sitk_mask,
+            resampling_grid.sitk_mask.GetPixelIDValue())
 
         if filename is None:
             filename = self._filename + "_" + interpolator_str
@@ -1147,11 +1245,28 @@ class Stack:
 
         return stack
 
-    def get_cropped_stack_based_on_mask(self, boundary_i=0, boundary_j=0, boundary_k=0, unit="mm"):
+    ##
+    # Gets the stack cropped to the bounding box of a mask.
+    #
+    # \param      self        The object
+    # \param      boundary_i  additional boundary in i-direction
+    # \param      boundary_j  additional boundary in j-direction
+    # \param      boundary_k  additional boundary in k-direction
+    # \param      unit        unit of boundaries, i.e. "mm" or "voxel"
+    # \param      mask_sitk   mask defining the bounding box as sitk.Image
+    #                         occupying the same space as the stack; stack
+    #                         mask is used if None
+    #
+    # \return     The cropped stack as Stack object
+    #
+    def get_cropped_stack_based_on_mask(self, boundary_i=0, boundary_j=0, boundary_k=0, unit="mm", mask_sitk=None):
+
+        if mask_sitk is None:
+            mask_sitk = self.sitk_mask
 
         # Get rectangular region surrounding the masked voxels
         [x_range, y_range, z_range] = self._get_rectangular_masked_region(
-            self.sitk_mask)
+            mask_sitk)
 
         if np.array([x_range, y_range, z_range]).all() is None:
             raise RuntimeError(
@@ -131,6 +131,9 @@ class Solver(object):
         # -----------------------------Set helpers-----------------------------
         self._N_stacks = len(self._stacks)
 
+        # Slices of all stacks (Stack.get_slices builds a new list per call)
+        self._slices_stacks = [stack.get_slices() for stack in self._stacks]
+
         # Compute total amount of pixels for all slices
         self._N_total_slice_voxels = 0
         for i in range(0, self._N_stacks):
@@ -150,6 +153,7 @@ class Solver(object):
 
         # Update helpers
         self._N_stacks = len(self._stacks)
+        self._slices_stacks = [stack.get_slices() for stack in self._stacks]
 
         # Compute total amount of pixels for all slices
         self._N_total_slice_voxels = 0
@@ -252,6 +256,9 @@ class Solver(object):
 
     def run(self):
 
+        # Update slices in case slices of the stacks were deleted meanwhile
+        self._slices_stacks = [stack.get_slices() for stack in self._stacks]
+
         # Run solver specific reconstruction
         self._run()
 
@@ -371,8 +378,7 @@ class Solver(object):
         # Define index for first voxel of first slice within array
         i_min = 0
 
-        for i, stack in enumerate(self._stacks):
-            slices = stack.get_slices()
+        for i, slices in enumerate(self._slices_stacks):
 
             # Get number of voxels of each slice in current stack
             N_slice_voxels = np.array(slices[0].sitk.GetSize()).prod()
@@ -390,7 +396,7 @@ class Solver(object):
                 else:
                     slice_itk = slice_j.itk
                 slice_nda_vec = self._itk2np.GetArrayFromImage(
-                    slice_itk).flatten()
+                    slice_itk).ravel()
 
                 # Fill respective elements
                 My[i_min:i_max] = slice_nda_vec
@@ -489,8 +495,7 @@ class Solver(object):
         # Define index for first voxel of first slice within array
         i_min = 0
 
-        for i, stack in enumerate(self._stacks):
-            slices = stack.get_slices()
+        for i, slices in enumerate(self._slices_stacks):
 
             # Get number of voxels of each slice in current stack
             N_slice_voxels = np.array(slices[0].sitk.GetSize()).prod()
@@ -505,8 +510,8 @@ class Solver(object):
                 slice_itk = self._Mk_Ak(x_itk, slice_j)
                 slice_nda = self._itk2np.GetArrayFromImage(slice_itk)
 
-                # Fill corresponding elements
-                MA_x[i_min:i_max] = slice_nda.flatten()
+                # Fill corresponding elements (ravel avoids an extra copy)
+                MA_x[i_min:i_max] = slice_nda.ravel()
 
                 # Define index for first voxel to specify subsequent slice
                 # (inclusive)
@@ -535,8 +540,7 @@ class Solver(object):
         # Define index for first voxel of first slice within array
         i_min = 0
 
-        for i, stack in enumerate(self._stacks):
-            slices = stack.get_slices()
+        for i, slices in enumerate(self._slices_stacks):
 
             # Get number of voxels of each slice in current stack
             N_slice_voxels = np.array(slices[0].sitk.GetSize()).prod()
@@ -555,7 +559,7 @@ class Solver(object):
                 # Apply A_k' M_k on current slice
                 Ak_adj_Mk_slice_itk = self._Ak_adj_Mk(slice_itk, slice_j)
                 Ak_adj_Mk_slice_nda_vec = self._itk2np.GetArrayFromImage(
-                    Ak_adj_Mk_slice_itk).flatten()
+                    Ak_adj_Mk_slice_itk).ravel()
 
                 # Add contribution
                 A_adj_M_y += Ak_adj_Mk_slice_nda_vec
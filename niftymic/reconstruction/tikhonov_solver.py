@@ -201,8 +201,8 @@ class TikhonovSolver(Solver):
             X_shape = self._reconstruction_shape
             Z_shape = grad(x0.reshape(*X_shape)).shape
 
-            B = lambda x: grad(x.reshape(*X_shape)).flatten()
-            B_adj = lambda x: grad_adj(x.reshape(*Z_shape)).flatten()
+            B = lambda x: grad(x.reshape(*X_shape)).ravel()
+            B_adj = lambda x: grad_adj(x.reshape(*Z_shape)).ravel()
 
         # Set up solver
         solver = tk.TikhonovLinearSolver(
@@ -368,8 +368,8 @@ class TemporalTikhonovSolver(object):
             X_shape = shape_x
             Z_shape = grad(x0.reshape(*X_shape)).shape
 
-            self._B = lambda x: grad(x.reshape(*X_shape)).flatten()
-            self._B_adj = lambda x: grad_adj(x.reshape(*Z_shape)).flatten()
+            self._B = lambda x: grad(x.reshape(*X_shape)).ravel()
+            self._B_adj = lambda x: grad_adj(x.reshape(*Z_shape)).ravel()
 
         self._B_shape = (self._B(x0).size, x0.size)
 
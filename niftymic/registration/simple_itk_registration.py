@@ -230,3 +230,38 @@ class SimpleItkRegistration(AffineRegistrationMethod):
             self._moving.sitk.GetPixelIDValue()
         )
         return warped_moving_sitk
+
+
+##
+# Gets the in-process rigid registration used as alternative to FLIRT and
+# RegAladin for volume-to-volume registrations (v2v-method "SimpleITK").
+# \date       2026-10-15 17:40:26+0100
+#
+# \param      fixed            Fixed image as Stack object
+# \param      moving           Moving image as Stack object
+# \param      use_fixed_mask   Use fixed mask, bool
+# \param      use_moving_mask  Use moving mask, bool
+# \param      use_verbose      Verbose output, bool
+#
+# \return     SimpleItkRegistration object
+#
+def get_rigid_volume_to_volume_registration(fixed=None,
+                                            moving=None,
+                                            use_fixed_mask=True,
+                                            use_moving_mask=True,
+                                            use_verbose=False,
+                                            ):
+    return SimpleItkRegistration(
+        fixed=fixed,
+        moving=moving,
+        registration_type="Rigid",
+        use_fixed_mask=use_fixed_mask,
+        use_moving_mask=use_moving_mask,
+        interpolator="Linear",
+        metric="Correlation",
+        use_multiresolution_framework=True,
+        shrink_factors=[4, 2, 1],
+        smoothing_sigmas=[2, 1, 0],
+        initializer_type="SelfGEOMETRY",
+        use_verbose=use_verbose,
+    )
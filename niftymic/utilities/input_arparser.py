@@ -10,6 +10,7 @@
 import os
 import re
 import six
+import json
 import sys
 import inspect
 import argparse
@@ -87,20 +88,8 @@ class InputArgparser(object):
 
     def print_arguments(self, args, title="Configuration:"):
         ph.print_title(title)
-        for arg in sorted(vars(args)):
-            ph.print_info("%s: " % (arg), newline=False)
-            vals = getattr(args, arg)
-
-            if type(vals) is list:
-                # print list element in new lines, unless only one entry in list
-                # if len(vals) == 1:
-                #     print(vals[0])
-                # else:
-                print("")
-                for val in vals:
-                    print("\t%s" % val)
-            else:
-                print(vals)
+        # Serialize all arguments at once instead of printing them one by one
+        print(json.dumps(vars(args), indent=4, sort_keys=True, default=str))
         print("\nNiftyMIC version: %s" % niftymic.__version__)
         ph.print_line_separator(add_newline=False)
         print("")
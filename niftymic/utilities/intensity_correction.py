@@ -267,7 +267,7 @@ class IntensityCorrection(object):
             for i in range(0, N_slices):
                 if self._use_verbose:
                     sys.stdout.write("Slice %2d/%d: " %
-                                     (i, self._stack.get_number_of_slices() - 1))
+                                     (i, N_slices - 1))
                     sys.stdout.flush()
                 if self._additional_stack is None:
                     nda[i, :, :], correction_coefficients[i, :] = self._apply_intensity_correction[
@@ -122,7 +122,7 @@ class MotionUpdater(object):
                     for f in os.listdir(abs_path_to_directory) if p.match(f)
                 }
                 slices = self._stacks[i].get_slices()
-                for i_slice in range(self._stacks[i].get_number_of_slices()):
+                for i_slice in range(len(slices)):
                     if i_slice in dic_slice_transforms.keys():
                         transform_slice_sitk = sitkh.read_transform_sitk(
                             dic_slice_transforms[i_slice])
@@ -173,7 +173,7 @@ class MotionUpdater(object):
                     for f in os.listdir(abs_path_to_directory) if p.match(f)
                 }
                 slices = self._stacks[i].get_slices()
-                for i_slice in range(self._stacks[i].get_number_of_slices()):
+                for i_slice in range(len(slices)):
                     if i_slice in dic_slice_transforms.keys():
                         path_to_slice = re.sub(
                             ".tfm", ".nii.gz", dic_slice_transforms[i_slice])
@@ -12,6 +12,7 @@
 
 import six
 import numpy as np
+import multiprocessing
 import SimpleITK as sitk
 from abc import ABCMeta, abstractmethod
 
@@ -297,7 +298,6 @@ class SliceSetToVolumeRegistration(RegistrationPipeline):
     def _run(self, debug=1):
 
         stack = self._stacks[0]
-        slices = stack.get_slices()
         for i, indices in enumerate(self._slice_set_indices):
             txt = "%s Split %d/%d -- Slices %s" % (
                 self._print_prefix, i + 1,
@@ -307,39 +307,31 @@ class SliceSetToVolumeRegistration(RegistrationPipeline):
             else:
                 ph.print_info(txt)
 
-                image = self._get_stack_subgroup(indices)
-
-                if debug:
-                    first = np.linalg.norm(
-                        stack.get_slice(indices[0]).sitk.GetOrigin() -
-                        np.array(image.sitk[:, :, 0:1].GetOrigin()))
-                    last = np.linalg.norm(
-                        stack.get_slice(indices[-1]).sitk.GetOrigin() -
-                        np.array(image.sitk[:, :, -1:].GetOrigin()))
-                    if first > 1e-6:
-                        raise RuntimeError(
-                            "Hierarchical S2V: first slice position flawed")
-                    if last > 1e-6:
-                        raise RuntimeError(
-                            "Hierarchical S2V: last slice position flawed")
-
-                self._registration_method.set_fixed(image)
-                self._registration_method.run()
-                transform_sitk = self._registration_method.\
-                    get_registration_transform_sitk()
-
-                for j in indices:
-                    slices[j].update_motion_correction(transform_sitk)
-
-                # if debug:
-                #     image_after = self._get_stack_subgroup(indices)
-                #     ph.killall_itksnap()
-                #     print(stack.get_filename())
-                #     sitkh.show_stacks(
-                #         [self._reference, image, image_after],
-                #         label=["reference", "before", "after"]
-                #         # segmentation=image,
-                #     )
+            image = self._get_stack_subgroup(indices)
+
+            if debug:
+                origins = stack.get_slice_origins(
+                    [indices[0], indices[-1]])
+                first = np.linalg.norm(
+                    origins[0] -
+                    np.array(image.sitk[:, :, 0:1].GetOrigin()))
+                last = np.linalg.norm(
+                    origins[-1] -
+                    np.array(image.sitk[:, :, -1:].GetOrigin()))
+                if first > 1e-6:
+                    raise RuntimeError(
+                        "Hierarchical S2V: first slice position flawed")
+                if last > 1e-6:
+                    raise RuntimeError(
+                        "Hierarchical S2V: last slice position flawed")
+
+            self._registration_method.set_fixed(image)
+            self._registration_method.run()
+            transform_sitk = self._registration_method.\
+                get_registration_transform_sitk()
+
+            stack.update_joint_motion_correction_of_slices(
+                transform_sitk, indices)
 
     ##
     # Gets the bundled stack of selected slices.
@@ -355,21 +347,9 @@ class SliceSetToVolumeRegistration(RegistrationPipeline):
 
         stack = self._stacks[0]
 
-        # For some reason simple element indexing does not work for sitk
-        # Problem: indices = [ 8 10 12 14]; but only 3 (!) slices are indexed!
-        # But this happens quite irregularly!?
-        # print all_[indices[0]:indices[-1]+1:self._interleave]
-        # print all_
-        # image_sitk = stack.sitk[
-        #     :,
-        #     :,
-        #     indices[0]:indices[-1]+self._interleave:self._interleave]
-        # image_sitk_mask = stack.sitk_mask[
-        #     :,
-        #     :,
-        #     indices[0]:indices[-1]+self._interleave:self._interleave]
-
-        # Build image from selected slices
+        # Build image from selected slices (simple element indexing of sitk
+        # images does not reliably select all slices, e.g. only 3 out of
+        # indices = [8, 10, 12, 14])
         nda = sitk.GetArrayFromImage(stack.sitk)
         nda_mask = sitk.GetArrayFromImage(stack.sitk_mask)
 
@@ -382,7 +362,7 @@ class SliceSetToVolumeRegistration(RegistrationPipeline):
         slice_sitk = stack.get_slice(indices[0]).sitk
 
         direction = slice_sitk.GetDirection()
-        origin = slice_sitk.GetOrigin()
+        origin = stack.get_slice(indices[0]).get_origin()
         spacing = np.array(slice_sitk.GetSpacing())
 
         # Update slice spacing according to selected interleave
@@ -495,6 +475,9 @@ class TwoStepSliceToVolumeRegistrationReconstruction(
     # \param      interleave                     The interleave
     # \param      viewer                         The viewer
     # \param      sigma_sda_mask                 The sigma sda mask
+    # \param      n_processes                    Number of processes used
+    #                                            for hierarchical
+    #                                            registration, integer
     #
     def __init__(self,
                  stacks,
@@ -511,6 +494,7 @@ class TwoStepSliceToVolumeRegistrationReconstruction(
                  interleave=3,
                  viewer=VIEWER,
                  sigma_sda_mask=1.,
+                 n_processes=1,
                  ):
 
         # Last volumetric reconstruction step is performed outside
@@ -542,6 +526,7 @@ class TwoStepSliceToVolumeRegistrationReconstruction(
         self._thresholds = thresholds
         self._use_hierarchical_registration = use_hierarchical_registration
         self._interleave = interleave
+        self._n_processes = n_processes
 
     def _run(self):
 
@@ -568,6 +553,7 @@ class TwoStepSliceToVolumeRegistrationReconstruction(
                     viewer=self._viewer,
                     min_slices=1,
                     verbose=False,
+                    n_processes=self._n_processes,
                 )
                 hs2vreg.run()
                 self._computational_time_registration += \
@@ -647,6 +633,42 @@ class TwoStepSliceToVolumeRegistrationReconstruction(
                                       viewer=self._viewer)
 
 
+##
+# Serialize sitk transforms so that they can be sent between processes.
+# \date       2026-10-15 11:08:14+0100
+#
+# \param      transforms_sitk  list of sitk transform objects
+#
+# \return     list of (name, dimension, parameters, fixed parameters) tuples
+#
+def _get_serialized_sitk_transforms(transforms_sitk):
+    return [(t.GetName(), t.GetDimension(),
+             t.GetParameters(), t.GetFixedParameters())
+            for t in transforms_sitk]
+
+
+##
+# Restore sitk transforms serialized by _get_serialized_sitk_transforms
+# \date       2026-10-15 11:08:14+0100
+#
+# \param      transforms  list of (name, dimension, parameters, fixed
+#                         parameters) tuples
+#
+# \return     list of sitk transform objects
+#
+def _get_deserialized_sitk_transforms(transforms):
+    transforms_sitk = []
+    for name, dimension, parameters, fixed_parameters in transforms:
+        if name == "AffineTransform":
+            transform_sitk = sitk.AffineTransform(dimension)
+        else:
+            transform_sitk = getattr(sitk, name)()
+        transform_sitk.SetFixedParameters(fixed_parameters)
+        transform_sitk.SetParameters(parameters)
+        transforms_sitk.append(transform_sitk)
+    return transforms_sitk
+
+
 ##
 # Class to perform hierarchical slice alignment.
 #
@@ -668,6 +690,8 @@ class HieararchicalSliceSetRegistration(RegistrationPipeline):
     # \param      min_slices           The minimum slices
     # \param      verbose              The verbose
     # \param      viewer               The viewer
+    # \param      n_processes          Number of processes to register the
+    #                                  stacks in parallel, integer
     #
     def __init__(self,
                  stacks,
@@ -677,6 +701,7 @@ class HieararchicalSliceSetRegistration(RegistrationPipeline):
                  min_slices=1,
                  verbose=1,
                  viewer=VIEWER,
+                 n_processes=1,
                  ):
 
         RegistrationPipeline.__init__(
@@ -689,6 +714,7 @@ class HieararchicalSliceSetRegistration(RegistrationPipeline):
         )
         self._interleave = interleave
         self._min_slices = min_slices
+        self._n_processes = n_processes
 
     def _run(self, debug=0):
         ph.print_title(
@@ -698,36 +724,149 @@ class HieararchicalSliceSetRegistration(RegistrationPipeline):
 
         self._registration_method.set_moving(self._reference)
 
-        for i_stack, stack in enumerate(self._stacks):
-            n_slices = stack.get_number_of_slices()
-            for i in range(self._interleave):
-                package = list(np.arange(i, n_slices, self._interleave))
-                if len(package) / 2 >= self._min_slices:
-                    indices_splits = self._recursive_split(
-                        package, [], self._min_slices)
-                else:
-                    indices_splits = [package]
-
-                prefix = "Hierarchical S2V-Reg: " \
-                    "Stack %d/%d (%s) -- Interleave %d/%d --" % (
-                        i_stack + 1, len(self._stacks), stack.get_filename(),
-                        i + 1, self._interleave,
-                    )
-                if debug:
-                    ph.print_subtitle(
-                        "%s %d splits: %s" % (
-                            prefix, len(indices_splits), indices_splits),
-                    )
-
-                ss2vreg = SliceSetToVolumeRegistration(
-                    print_prefix=prefix,
-                    stack=stack,
-                    reference=self._reference,
-                    registration_method=self._registration_method,
-                    slice_set_indices=indices_splits,
-                    verbose=self._verbose,
+        n_processes = min(self._n_processes, N_stacks)
+        if n_processes > 1:
+            # Worker processes are forked so that they inherit this object,
+            # i.e. stacks and reference are not pickled
+            try:
+                context = multiprocessing.get_context("fork")
+            except AttributeError:
+                # Python 2 forks by default
+                context = multiprocessing
+            except ValueError:
+                ph.print_warning(
+                    "Forking processes is not supported on this platform. "
+                    "Stacks are registered sequentially.")
+                n_processes = 1
+
+        if n_processes <= 1:
+            for i_stack in range(N_stacks):
+                self._run_stack(i_stack, debug=debug)
+            return
+
+        # Stacks are registered independently in worker processes. Only the
+        # obtained slice transforms are sent back.
+        queue_stacks = context.Queue()
+        queue_histories = context.Queue()
+        for i_stack in range(N_stacks):
+            queue_stacks.put(i_stack)
+        for i in range(n_processes):
+            queue_stacks.put(None)
+
+        processes = [
+            context.Process(
+                target=self._run_worker,
+                args=(queue_stacks, queue_histories, debug))
+            for i in range(n_processes)
+        ]
+        for process in processes:
+            process.start()
+
+        try:
+            for i in range(N_stacks):
+                i_stack, histories, error = self._get_worker_result(
+                    queue_histories, processes)
+                if error is not None:
+                    raise RuntimeError(
+                        "Hierarchical S2V-Reg of stack %d failed: %s" % (
+                            i_stack + 1, error))
+                slices = self._stacks[i_stack].get_slices()
+                for slice, history in zip(slices, histories):
+                    slice.set_registration_history([
+                        _get_deserialized_sitk_transforms(h)
+                        for h in history])
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+    ##
+    # Wait for the next result of the worker processes.
+    # \date       2026-10-15 17:02:19+0100
+    #
+    # \param      queue_histories  queue the workers put their results in
+    # \param      processes        list of worker processes
+    #
+    # \return     stack index, serialized registration histories and error
+    #             message of the next registered stack
+    #
+    @staticmethod
+    def _get_worker_result(queue_histories, processes):
+        while True:
+            try:
+                return queue_histories.get(timeout=1)
+            except six.moves.queue.Empty:
+                # Avoid waiting forever for a worker that was killed
+                if any(p.exitcode not in [None, 0] for p in processes):
+                    raise RuntimeError(
+                        "Hierarchical S2V-Reg worker process terminated "
+                        "unexpectedly")
+
+    ##
+    # Register stacks in a worker process until no stack index is left.
+    # \date       2026-10-15 17:02:19+0100
+    #
+    # \param      self             The object
+    # \param      queue_stacks     queue of stack indices; None signals the
+    #                              end
+    # \param      queue_histories  queue to return the stack index, the
+    #                              serialized registration histories of its
+    #                              slices and an error message (or None)
+    # \param      debug            The debug
+    #
+    def _run_worker(self, queue_stacks, queue_histories, debug=0):
+        for i_stack in iter(queue_stacks.get, None):
+            try:
+                self._run_stack(i_stack, debug=debug)
+                histories = [
+                    [_get_serialized_sitk_transforms(h)
+                     for h in slice.get_registration_history()]
+                    for slice in self._stacks[i_stack].get_slices()
+                ]
+                queue_histories.put((i_stack, histories, None))
+            except Exception as e:
+                queue_histories.put((i_stack, None, str(e)))
+
+    ##
+    # Perform hierarchical slice set registration for a single stack
+    # \date       2026-10-15 11:02:36+0100
+    #
+    # \param      self     The object
+    # \param      i_stack  Index of stack, integer
+    # \param      debug    The debug
+    #
+    def _run_stack(self, i_stack, debug=0):
+        stack = self._stacks[i_stack]
+        n_slices = stack.get_number_of_slices()
+        for i in range(self._interleave):
+            package = list(np.arange(i, n_slices, self._interleave))
+            if len(package) / 2 >= self._min_slices:
+                indices_splits = self._recursive_split(
+                    package, [], self._min_slices)
+            else:
+                indices_splits = [package]
+
+            prefix = "Hierarchical S2V-Reg: " \
+                "Stack %d/%d (%s) -- Interleave %d/%d --" % (
+                    i_stack + 1, len(self._stacks), stack.get_filename(),
+                    i + 1, self._interleave,
                 )
-                ss2vreg.run()
+            if debug:
+                ph.print_subtitle(
+                    "%s %d splits: %s" % (
+                        prefix, len(indices_splits), indices_splits),
+                )
+
+            ss2vreg = SliceSetToVolumeRegistration(
+                print_prefix=prefix,
+                stack=stack,
+                reference=self._reference,
+                registration_method=self._registration_method,
+                slice_set_indices=indices_splits,
+                verbose=self._verbose,
+            )
+            ss2vreg.run()
 
     ##
     # Split list of arrays into halfs.
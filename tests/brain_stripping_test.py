@@ -13,11 +13,15 @@ import SimpleITK as sitk
 import pysitk.simple_itk_helper as sitkh
 
 import niftymic.utilities.brain_stripping as bs
-from niftymic.definitions import DIR_TEST
+from niftymic.definitions import DIR_TEST, DIR_TMP
 
 
 class BrainStrippingTest(unittest.TestCase):
 
+    # Tests are independent and can be distributed over processes, e.g.
+    # python -m nose --processes=2 tests/brain_stripping_test.py
+    _multiprocess_can_split_ = True
+
     # Specify input data
     dir_test_data = DIR_TEST
 
@@ -29,10 +33,14 @@ class BrainStrippingTest(unittest.TestCase):
             DIR_TEST, "case-studies", "fetal-brain", "input-data")
         self.filename = "axial"
 
+        # Separate directory for each test to allow concurrent test runs
+        self.dir_tmp = os.path.join(
+            DIR_TMP, "BrainExtractionTool", self._testMethodName)
+
     def test_01_input_output(self):
 
         brain_stripping = bs.BrainStripping.from_filename(
-            self.dir_data, self.filename)
+            self.dir_data, self.filename, dir_tmp=self.dir_tmp)
         brain_stripping.compute_brain_image(0)
         brain_stripping.compute_brain_mask(0)
         brain_stripping.compute_skull_image(0)
@@ -61,7 +69,7 @@ class BrainStrippingTest(unittest.TestCase):
             DIR_TEST, "case-studies", "fetal-brain", "brain_stripping", "axial_seg.nii.gz")
 
         brain_stripping = bs.BrainStripping.from_filename(
-            self.dir_data, self.filename)
+            self.dir_data, self.filename, dir_tmp=self.dir_tmp)
         brain_stripping.compute_brain_image(0)
         brain_stripping.compute_brain_mask(1)
         brain_stripping.compute_skull_image(0)
@@ -0,0 +1,105 @@
+##
+# \file hierarchical_slice_set_registration_test.py
+#  \brief  Unit tests for the hierarchical slice set registration
+#
+#  \author Michael Ebner (michael.ebner.14@ucl.ac.uk)
+#  \date October 2026
+
+
+import unittest
+import numpy as np
+import SimpleITK as sitk
+
+import niftymic.base.stack as st
+import niftymic.registration.simple_itk_registration as regsitk
+import niftymic.utilities.volumetric_reconstruction_pipeline as pipeline
+
+
+class HierarchicalSliceSetRegistrationTest(unittest.TestCase):
+
+    accuracy = 6
+
+    def setUp(self):
+        # Reference volume of smooth, non-symmetric structure
+        nda = np.zeros((40, 40, 40))
+        nda[12:30, 10:26, 14:32] = 1
+        nda[20:26, 24:34, 8:18] = 2
+        reference_sitk = sitk.SmoothingRecursiveGaussian(
+            sitk.GetImageFromArray(nda), 2)
+        self.reference = st.Stack.from_sitk_image(
+            reference_sitk, slice_thickness=1, filename="reference")
+
+        # Stacks of thick slices with slightly perturbed orientation
+        self.stacks = []
+        for i, angle in enumerate([0.05, -0.08]):
+            rotation = sitk.Euler3DTransform()
+            rotation.SetCenter(reference_sitk.TransformContinuousIndexToPhysicalPoint(
+                [19.5, 19.5, 19.5]))
+            rotation.SetRotation(angle, -angle, 0)
+            grid_sitk = sitk.Image([40, 40, 12], sitk.sitkFloat64)
+            grid_sitk.SetSpacing((1., 1., 3.))
+            grid_sitk.SetOrigin((0., 0., 2.))
+            stack_sitk = sitk.Resample(
+                reference_sitk, grid_sitk, rotation, sitk.sitkLinear)
+            self.stacks.append(st.Stack.from_sitk_image(
+                stack_sitk, slice_thickness=3, filename="stack%d" % i))
+
+    def _get_registered_stacks(self, n_processes):
+        stacks = [st.Stack.from_stack(s) for s in self.stacks]
+        registration = regsitk.SimpleItkRegistration(
+            use_fixed_mask=True,
+            use_moving_mask=True,
+            interpolator="Linear",
+            metric="Correlation",
+            optimizer_params={
+                "minStep": 1e-6,
+                "numberOfIterations": 20,
+                "gradientMagnitudeTolerance": 1e-6,
+                "learningRate": 1,
+            },
+        )
+        hs2vreg = pipeline.HieararchicalSliceSetRegistration(
+            stacks=stacks,
+            reference=self.reference,
+            registration_method=registration,
+            interleave=2,
+            min_slices=2,
+            verbose=False,
+            n_processes=n_processes,
+        )
+        hs2vreg.run()
+        return hs2vreg.get_stacks()
+
+    def test_parallel_registration_matches_sequential_one(self):
+        stacks_sequential = self._get_registered_stacks(n_processes=1)
+        stacks_parallel = self._get_registered_stacks(n_processes=2)
+
+        for stack_sequential, stack_parallel in zip(
+                stacks_sequential, stacks_parallel):
+            for slice_sequential, slice_parallel in zip(
+                    stack_sequential.get_slices(),
+                    stack_parallel.get_slices()):
+
+                history_sequential = \
+                    slice_sequential.get_registration_history()
+                history_parallel = slice_parallel.get_registration_history()
+
+                for transforms_sequential, transforms_parallel in zip(
+                        history_sequential, history_parallel):
+                    self.assertEqual(
+                        len(transforms_sequential), len(transforms_parallel))
+                    for t_sequential, t_parallel in zip(
+                            transforms_sequential, transforms_parallel):
+                        self.assertEqual(
+                            t_sequential.GetName(), t_parallel.GetName())
+                        self.assertAlmostEqual(
+                            np.max(np.abs(
+                                np.array(t_sequential.GetParameters()) -
+                                t_parallel.GetParameters())),
+                            0, places=self.accuracy)
+
+                self.assertAlmostEqual(
+                    np.max(np.abs(
+                        np.array(slice_sequential.sitk.GetOrigin()) -
+                        slice_parallel.sitk.GetOrigin())),
+                    0, places=self.accuracy)
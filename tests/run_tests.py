@@ -15,12 +15,14 @@ from brain_stripping_test import *
 from case_study_fetal_brain_test import *
 from case_study_rsfmri_test import *
 from data_reader_test import *
+from hierarchical_slice_set_registration_test import *
 from image_similarity_evaluator_test import *
 from intensity_correction_test import *
 from linear_operators_test import *
 from niftyreg_test import *
 from residual_evaluator_test import *
 from segmentation_propagation_test import *
+from slice_test import *
 # from simulator_slice_acquisition_test import *  # only in dev branch
 from stack_test import *
 
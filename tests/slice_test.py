@@ -0,0 +1,123 @@
+##
+# \file slice_test.py
+#  \brief  Class containing unit tests for module Slice
+#
+#  \author Michael Ebner (michael.ebner.14@ucl.ac.uk)
+#  \date October 2026
+
+
+import unittest
+import numpy as np
+import SimpleITK as sitk
+
+import pysitk.simple_itk_helper as sitkh
+
+import niftymic.base.slice as sl
+
+
+class SliceTest(unittest.TestCase):
+
+    accuracy = 10
+
+    def setUp(self):
+        slice_sitk = sitk.GetImageFromArray(
+            np.random.RandomState(0).rand(1, 20, 25))
+        slice_sitk.SetSpacing((0.8, 0.9, 3.))
+        slice_sitk.SetOrigin((-10., 5., 20.))
+        rotation = sitk.Euler3DTransform()
+        rotation.SetRotation(0.2, -0.1, 0.3)
+        slice_sitk.SetDirection(rotation.GetMatrix())
+
+        self.slice = sl.Slice.from_sitk_image(
+            slice_sitk, slice_number=0, slice_thickness=3.)
+
+        self.transform_sitk = sitk.Euler3DTransform()
+        self.transform_sitk.SetCenter((3., -2., 25.))
+        self.transform_sitk.SetRotation(0.1, 0.05, -0.2)
+        self.transform_sitk.SetTranslation((1., 2., -3.))
+
+    def _assert_origin_matches_image(self, slice):
+        self.assertAlmostEqual(
+            np.max(np.abs(
+                slice.get_origin() - np.array(slice.sitk.GetOrigin()))),
+            0, places=self.accuracy)
+        self.assertAlmostEqual(
+            np.max(np.abs(
+                slice.get_origin() - np.array(slice.sitk_mask.GetOrigin()))),
+            0, places=self.accuracy)
+
+    def test_homogeneous_matrix_round_trip(self):
+        transform_sitk = sitk.AffineTransform(3)
+        transform_sitk.SetMatrix(
+            (np.eye(3) + 0.1 * np.random.RandomState(1).rand(3, 3)).flatten())
+        transform_sitk.SetTranslation((1., -2., 3.))
+        transform_sitk.SetCenter((5., 7., -4.))
+
+        H = sl.Slice.get_homogeneous_matrix_from_sitk_transform(
+            transform_sitk)
+        transform_2_sitk = \
+            sl.Slice.get_sitk_affine_transform_from_homogeneous_matrix(H)
+
+        self.assertEqual(transform_2_sitk.GetCenter(), (0, 0, 0))
+        for point in np.random.RandomState(2).rand(10, 3) * 100:
+            self.assertAlmostEqual(
+                np.max(np.abs(
+                    np.array(transform_sitk.TransformPoint(point)) -
+                    transform_2_sitk.TransformPoint(point))),
+                0, places=self.accuracy)
+
+        H_2 = sl.Slice.get_homogeneous_matrix_from_sitk_transform(
+            transform_2_sitk)
+        self.assertAlmostEqual(
+            np.max(np.abs(H - H_2)), 0, places=self.accuracy)
+
+    def test_origin_after_update_motion_correction(self):
+        affine_transform_sitk = sitkh.get_composite_sitk_affine_transform(
+            self.transform_sitk, self.slice.get_affine_transform())
+        origin = sitkh.get_sitk_image_origin_from_sitk_affine_transform(
+            affine_transform_sitk, self.slice.sitk)
+
+        self.slice.update_motion_correction(self.transform_sitk)
+
+        self._assert_origin_matches_image(self.slice)
+        self.assertAlmostEqual(
+            np.max(np.abs(self.slice.get_origin() - origin)),
+            0, places=self.accuracy)
+
+    def test_origin_after_set_registration_history(self):
+        slice_moved = sl.Slice.from_slice(self.slice)
+        slice_moved.update_motion_correction(self.transform_sitk)
+
+        self.slice.set_registration_history(
+            slice_moved.get_registration_history())
+
+        self._assert_origin_matches_image(self.slice)
+        self.assertAlmostEqual(
+            np.max(np.abs(
+                self.slice.get_origin() - slice_moved.get_origin())),
+            0, places=self.accuracy)
+        self.assertAlmostEqual(
+            np.max(np.abs(
+                np.array(self.slice.sitk.GetDirection()) -
+                slice_moved.sitk.GetDirection())),
+            0, places=self.accuracy)
+
+    def test_update_joint_motion_correction(self):
+        slices_joint = [sl.Slice.from_slice(self.slice) for i in range(3)]
+        slices_single = [sl.Slice.from_slice(self.slice) for i in range(3)]
+
+        sl.Slice.update_joint_motion_correction(
+            slices_joint, self.transform_sitk)
+        for slice in slices_single:
+            slice.update_motion_correction(self.transform_sitk)
+
+        for slice_joint, slice_single in zip(slices_joint, slices_single):
+            self._assert_origin_matches_image(slice_joint)
+            self.assertAlmostEqual(
+                np.max(np.abs(
+                    slice_joint.get_affine_transform_nda() -
+                    slice_single.get_affine_transform_nda())),
+                0, places=self.accuracy)
+            self.assertEqual(
+                slice_joint.get_motion_correction_transform().GetName(),
+                slice_single.get_motion_correction_transform().GetName())
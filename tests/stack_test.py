@@ -11,6 +11,8 @@ import unittest
 import random
 import os
 
+import pysitk.simple_itk_helper as sitkh
+
 import niftymic.base.stack as st
 import niftymic.base.data_reader as dr
 import niftymic.base.exceptions as exceptions
@@ -30,6 +32,109 @@ class StackTest(unittest.TestCase):
     def setUp(self):
         pass
 
+    ##
+    # Create an obliquely oriented stack whose slices underwent individual
+    # random rigid motions.
+    # \date       2026-10-15 16:05:12+0100
+    #
+    @staticmethod
+    def _get_moved_stack(seed=0):
+        nda = np.random.RandomState(seed).rand(6, 25, 30)
+        image_sitk = sitk.GetImageFromArray(nda)
+        image_sitk.SetSpacing((0.8, 0.9, 3.))
+        image_sitk.SetOrigin((-10., 5., 20.))
+        rotation = sitk.Euler3DTransform()
+        rotation.SetRotation(0.2, -0.1, 0.3)
+        image_sitk.SetDirection(rotation.GetMatrix())
+
+        stack = st.Stack.from_sitk_image(
+            image_sitk, slice_thickness=3., filename="moved")
+
+        motion_simulator = ms.RandomRigidMotionSimulator(
+            dimension=3, angle_max_deg=10, translation_max=5)
+        motion_simulator.simulate_motion(
+            seed=seed, simulations=stack.get_number_of_slices())
+        for slice, transform_sitk in zip(
+                stack.get_slices(), motion_simulator.get_transforms_sitk()):
+            slice.update_motion_correction(transform_sitk)
+
+        return stack
+
+    def test_update_joint_motion_correction_of_slices(self):
+
+        stack = self._get_moved_stack()
+
+        transform_sitk = sitk.Euler3DTransform()
+        transform_sitk.SetCenter((3., -2., 25.))
+        transform_sitk.SetRotation(0.1, 0.05, -0.2)
+        transform_sitk.SetTranslation((1., 2., -3.))
+
+        for indices in [None, [1, 3, 4]]:
+            stack_joint = st.Stack.from_stack(stack)
+            stack_joint.update_joint_motion_correction_of_slices(
+                transform_sitk, indices)
+
+            stack_single = st.Stack.from_stack(stack)
+
+            if indices is None:
+                indices = range(stack.get_number_of_slices())
+
+            for i, slice in enumerate(stack.get_slices()):
+                slice_joint = stack_joint.get_slices()[i]
+                slice_single = stack_single.get_slices()[i]
+
+                if i in indices:
+                    slice_single.update_motion_correction(transform_sitk)
+
+                    # Expected outcome based on composited sitk transforms
+                    motion_correction_sitk = \
+                        sitkh.get_composite_sitk_affine_transform(
+                            transform_sitk,
+                            slice.get_motion_correction_transform())
+                    affine_transform_sitk = \
+                        sitkh.get_composite_sitk_affine_transform(
+                            transform_sitk, slice.get_affine_transform())
+                    origin = \
+                        sitkh.get_sitk_image_origin_from_sitk_affine_transform(
+                            affine_transform_sitk, slice.sitk)
+                    direction = sitkh.\
+                        get_sitk_image_direction_from_sitk_affine_transform(
+                            affine_transform_sitk, slice.sitk)
+                else:
+                    motion_correction_sitk = \
+                        slice.get_motion_correction_transform()
+                    origin = slice.sitk.GetOrigin()
+                    direction = slice.sitk.GetDirection()
+
+                for slice_updated in [slice_joint, slice_single]:
+                    self.assertAlmostEqual(
+                        np.max(np.abs(
+                            np.array(slice_updated.sitk.GetOrigin()) -
+                            origin)),
+                        0, places=10)
+                    self.assertAlmostEqual(
+                        np.max(np.abs(
+                            np.array(slice_updated.sitk.GetDirection()) -
+                            direction)),
+                        0, places=10)
+                    self.assertAlmostEqual(
+                        np.max(np.abs(
+                            np.array(slice_updated.sitk_mask.GetOrigin()) -
+                            origin)),
+                        0, places=10)
+
+                    motion_correction_updated_sitk = \
+                        slice_updated.get_motion_correction_transform()
+                    self.assertEqual(
+                        motion_correction_updated_sitk.GetName(),
+                        motion_correction_sitk.GetName())
+                    self.assertAlmostEqual(
+                        np.max(np.abs(
+                            np.array(motion_correction_updated_sitk.
+                                     GetParameters()) -
+                            motion_correction_sitk.GetParameters())),
+                        0, places=10)
+
     def test_get_resampled_stack_from_slices(self):
 
         filename = "stack0"
@@ -57,6 +162,30 @@ class StackTest(unittest.TestCase):
         self.assertEqual(np.round(
             np.linalg.norm(nda_stack_mask - nda_stack_resampled_mask), decimals=self.accuracy), 0)
 
+    def test_get_slice_origins_with_deleted_slice(self):
+
+        stack = self._get_moved_stack()
+        stack.delete_slice(stack.get_slices()[1])
+
+        indices = [0, 2, 3]
+        slices = [stack.get_slices()[i] for i in indices]
+
+        origins = stack.get_slice_origins(indices)
+        self.assertAlmostEqual(
+            np.max(np.abs(
+                origins - np.array([s.sitk.GetOrigin() for s in slices]))),
+            0, places=10)
+
+        # Indices refer to the same slices as for the joint update
+        transform_sitk = sitk.Euler3DTransform()
+        transform_sitk.SetTranslation((1., 2., -3.))
+        stack.update_joint_motion_correction_of_slices(
+            transform_sitk, indices)
+        self.assertAlmostEqual(
+            np.max(np.abs(
+                stack.get_slice_origins(indices) - origins - (1., 2., -3.))),
+            0, places=10)
+
     def test_io_image_not_existent(self):
         # Neither fetal_brain_2.nii.gz nor fetal_brain_2.nii exists
         filename = "fetal_brain_2"